@@ -1,5 +1,13 @@
 import random
+import sys
 from enum import Enum
+from functools import lru_cache
+from math import comb, isfinite
+
+try:  # Optional compiled simulation core, see setup.py
+    from blackjack_core import play_hands as _play_hands_compiled
+except ImportError:
+    _play_hands_compiled = None
 
 
 class Suit(Enum):
@@ -27,43 +35,73 @@ class Rank(Enum):
     KING = ("K", 10)
 
 
+# Integer rank codes used by the game internals. The Rank enum stays the
+# public type and maps onto these codes in declaration order.
+(ACE, TWO, THREE, FOUR, FIVE, SIX, SEVEN,
+ EIGHT, NINE, TEN, JACK, QUEEN, KING) = range(len(Rank))
+LABELS = tuple(rank.value[0] for rank in Rank)
+VALUES = tuple(rank.value[1] for rank in Rank)
+RANK_INDEX = {rank: i for i, rank in enumerate(Rank)}
+
+
 class Card:
     """Represents a single playing card"""
     
     def __init__(self, suit, rank):
         self.suit = suit
         self.rank = rank
+        self.rank_idx = RANK_INDEX[rank]
+        self._val = VALUES[self.rank_idx]
     
     def __str__(self):
-        return f"{self.rank.value[0]}{self.suit.value}"
+        return f"{LABELS[self.rank_idx]}{self.suit.value}"
     
     def get_value(self):
         """Returns the card value (handles Ace as 11 or 1)"""
-        return self.rank.value[1]
+        return self._val
+
+
+# Every distinct card, built once. Decks store indexes into this table
+# (suit-major, 13 ranks per suit) instead of allocating Card objects.
+CARD_TABLE = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+
+# Card code to card value, padded to a full bytes.translate table
+CARD_VALUES = bytes(card.get_value() for card in CARD_TABLE).ljust(256, b"\0")
 
 
 class Deck:
     """Manages a deck of playing cards"""
     
-    def __init__(self, num_decks=1):
-        self.cards = []
+    def __init__(self, num_decks=1, seed=None):
         self.num_decks = num_decks
+        self.cards = bytearray(range(len(CARD_TABLE))) * num_decks
+        self.idx = 0
+        self.shuffles = 0  # Number of times the shoe has been shuffled
+        self._rng = random.Random(seed)
         self.reset()
     
     def reset(self):
-        """Create a fresh deck and shuffle"""
-        self.cards = []
-        for _ in range(self.num_decks):
-            for suit in Suit:
-                for rank in Rank:
-                    self.cards.append(Card(suit, rank))
-        random.shuffle(self.cards)
+        """Shuffle the full shoe back together"""
+        # The buffer always holds the whole shoe, so shuffling it in place
+        # is a fresh deck without rebuilding anything
+        self._rng.shuffle(self.cards)
+        self.idx = 0
+        self.shuffles += 1
     
     def deal_card(self):
         """Deal a card from the deck"""
-        if len(self.cards) < 10:  # Reshuffle when deck is low
+        if len(self.cards) - self.idx < 10:  # Reshuffle when deck is low
             self.reset()
-        return self.cards.pop()
+        card = CARD_TABLE[self.cards[self.idx]]
+        self.idx += 1
+        return card
+    
+    def counts(self):
+        """Count the undealt cards by card value (index 2-11)"""
+        counts = [0] * 12
+        for code in self.cards[self.idx:]:
+            counts[CARD_TABLE[code].get_value()] += 1
+        return counts
 
 
 class Hand:
@@ -71,72 +109,307 @@ class Hand:
     
     def __init__(self):
         self.cards = []
+        self._raw = 0  # Sum with every ace counted as 11
+        self._aces = 0
+        self._soft_aces = 0  # Aces still counted as 11
+        self._n = 0
     
     def add_card(self, card):
         """Add a card to the hand"""
         self.cards.append(card)
+        self._raw += card._val
+        self._aces += card.rank_idx == ACE
+        self._n += 1
+        # Count just enough aces as 1 to get back to 21, if the hand has them
+        excess = max(0, self._raw - 21)
+        self._soft_aces = self._aces - min(self._aces, (excess + 9) // 10)
+    
+    @property
+    def value(self):
+        """Hand value (handles Ace as 1 or 11)"""
+        return self._raw - 10 * (self._aces - self._soft_aces)
+    
+    @property
+    def soft(self):
+        """Whether an ace is still being counted as 11"""
+        return self._soft_aces > 0
+    
+    @property
+    def bust(self):
+        """Whether the hand exceeds 21"""
+        return self.value > 21
+    
+    @property
+    def blackjack(self):
+        """Whether the hand is a natural blackjack (21 with 2 cards)"""
+        return self._n == 2 and self.value == 21
     
     def get_value(self):
         """Calculate hand value (handles Ace as 1 or 11)"""
-        value = 0
-        aces = 0
-        
-        for card in self.cards:
-            value += card.get_value()
-            if card.rank == Rank.ACE:
-                aces += 1
-        
-        # Adjust for aces if busting
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        
-        return value
+        return self.value
+    
+    def is_soft(self):
+        """Check if an ace is still being counted as 11"""
+        return self.soft
     
     def is_blackjack(self):
         """Check if hand is a natural blackjack (21 with 2 cards)"""
-        return len(self.cards) == 2 and self.get_value() == 21
+        return self.blackjack
     
     def is_bust(self):
         """Check if hand exceeds 21"""
-        return self.get_value() > 21
+        return self.bust
+    
+    def format(self, name, hide_first=False):
+        """Format the hand as a single display line"""
+        cards_str = ", ".join([f"[{card}]" for card in self.cards])
+        value = "?" if hide_first else self.value
+        return f"{name}: {cards_str} (Value: {value})"
     
     def display(self, name, hide_first=False):
         """Display the hand"""
-        cards_str = ", ".join([f"[{card}]" for card in self.cards])
-        value = "?" if hide_first else str(self.get_value())
-        print(f"{name}: {cards_str} (Value: {value})")
+        sys.stdout.write(self.format(name, hide_first) + "\n")
+
+
+# Dealer outcome distributions for exact EV. Outcomes are indexed as
+# 17, 18, 19, 20, 21, bust; card kinds are card values 2-11 shifted to 0-9.
+
+NUM_KINDS = 10
+MAX_REMOVED = 8  # Largest removal from a full shoe that DealerCache stores
+
+# ADDRESS_TABLE[k][x]: number of k-card removals using only the x lowest kinds
+ADDRESS_TABLE = tuple(
+    tuple(comb(x + k - 1, k) if k else 1 for x in range(NUM_KINDS + 1))
+    for k in range(MAX_REMOVED + 1)
+)
+
+
+# Distribution of a dealer who has already stood on each final total
+_FINAL_OUTCOMES = {
+    total: tuple(float(i == min(total, 22) - 17) for i in range(6))
+    for total in range(17, 33)
+}
+
+
+@lru_cache(maxsize=200000)
+def _dealer_outcomes(total, soft, counts):
+    """Dealer outcome probabilities from a hand total (soft if an ace is
+    still counted as 11) when drawing from counts, a tuple of undealt
+    cards by card value"""
+    if total >= 17:
+        return _FINAL_OUTCOMES[total]
+    remaining = sum(counts)
+    dist = [0.0] * 6
+    for card in range(2, 12):
+        n = counts[card]
+        if not n:
+            continue
+        new_total = total + card
+        new_soft = soft or card == 11
+        if new_total > 21 and new_soft:
+            new_total -= 10
+            new_soft = soft and card == 11
+        rest = counts[:card] + (n - 1,) + counts[card + 1:]
+        p = n / remaining
+        for i, q in enumerate(_dealer_outcomes(new_total, new_soft, rest)):
+            dist[i] += p * q
+    return tuple(dist)
+
+
+def dealer_distribution(upcard, counts):
+    """Probabilities of each dealer outcome given the upcard value and the
+    undealt counts, given that the dealer does not have blackjack"""
+    counts = tuple(counts)
+    remaining = sum(counts)
+    blackjack_hole = {10: 11, 11: 10}.get(upcard)
+    hole_total = remaining - (counts[blackjack_hole] if blackjack_hole else 0)
+    dist = [0.0] * 6
+    for hole in range(2, 12):
+        n = counts[hole]
+        if not n or hole == blackjack_hole:
+            continue
+        total = upcard + hole
+        soft = upcard == 11 or hole == 11
+        if total == 22:  # Two aces
+            total = 12
+        rest = counts[:hole] + (n - 1,) + counts[hole + 1:]
+        p = n / hole_total
+        for i, q in enumerate(_dealer_outcomes(total, soft, rest)):
+            dist[i] += p * q
+    return tuple(dist)
+
+
+class DealerCache:
+    """Dealer outcome distributions for shoes with up to MAX_REMOVED cards
+    removed, stored at a combinatorial address of the removed cards"""
+    
+    def __init__(self, num_decks=6):
+        self.full_counts = [0] * 12
+        for card in CARD_TABLE:
+            self.full_counts[card.get_value()] += num_decks
+        self.size = comb(NUM_KINDS + MAX_REMOVED, MAX_REMOVED)
+        self._table = [None] * (NUM_KINDS * self.size)
+    
+    @staticmethod
+    def address(removed):
+        """Index of a removal, given its card kinds sorted high to low"""
+        j = len(removed)
+        if not j:
+            return 0
+        # Every smaller removal comes first, then removals of j cards in order
+        address = comb(NUM_KINDS + j - 1, j - 1)
+        for i, kind in enumerate(removed):
+            address += ADDRESS_TABLE[j - i][kind]
+        return address
+    
+    def get(self, upcard, counts):
+        """Dealer outcome distribution for the upcard value and undealt counts"""
+        removed = []
+        for value in range(11, 1, -1):
+            missing = self.full_counts[value] - counts[value]
+            if missing < 0:
+                raise ValueError("Counts contain more cards than the shoe")
+            removed.extend([value - 2] * missing)
+        if len(removed) > MAX_REMOVED:
+            return dealer_distribution(upcard, counts)
+        
+        slot = (upcard - 2) * self.size + self.address(removed)
+        dist = self._table[slot]
+        if dist is None:
+            dist = self._table[slot] = dealer_distribution(upcard, counts)
+        return dist
+
+
+# Basic strategy for a multi-deck shoe where the dealer stands on soft 17.
+# Tables are indexed [player_total - 4][dealer_upcard - 2], the upcard
+# columns running 2-10 then ace.
+
+STAND = 0
+HIT = 1
+DOUBLE = 2  # Double if allowed, otherwise hit
+DOUBLE_STAND = 3  # Double if allowed, otherwise stand
+
+_S, _H, _D, _DS = "SHDs"
+_ACTIONS = {_S: STAND, _H: HIT, _D: DOUBLE, _DS: DOUBLE_STAND}
+
+
+def _strategy_table(rows):
+    """Build a lookup table from rows of action letters, one per total"""
+    return tuple(bytes(_ACTIONS[a] for a in row) for row in rows)
+
+
+STRATEGY_HARD = _strategy_table([
+    "HHHHHHHHHH",  # 4
+    "HHHHHHHHHH",  # 5
+    "HHHHHHHHHH",  # 6
+    "HHHHHHHHHH",  # 7
+    "HHHHHHHHHH",  # 8
+    "HDDDDHHHHH",  # 9
+    "DDDDDDDDHH",  # 10
+    "DDDDDDDDDH",  # 11
+    "HHSSSHHHHH",  # 12
+    "SSSSSHHHHH",  # 13
+    "SSSSSHHHHH",  # 14
+    "SSSSSHHHHH",  # 15
+    "SSSSSHHHHH",  # 16
+    "SSSSSSSSSS",  # 17
+    "SSSSSSSSSS",  # 18
+    "SSSSSSSSSS",  # 19
+    "SSSSSSSSSS",  # 20
+    "SSSSSSSSSS",  # 21
+])
+
+# Soft totals only occur from 12 (two aces) upwards
+STRATEGY_SOFT = _strategy_table(["HHHHHHHHHH"] * 8 + [
+    "HHHHHHHHHH",  # 12
+    "HHHDDHHHHH",  # 13
+    "HHHDDHHHHH",  # 14
+    "HHDDDHHHHH",  # 15
+    "HHDDDHHHHH",  # 16
+    "HDDDDHHHHH",  # 17
+    "SssssSSHHH",  # 18
+    "SSSSSSSSSS",  # 19
+    "SSSSSSSSSS",  # 20
+    "SSSSSSSSSS",  # 21
+])
+
+
+def decide(player_total, is_soft, dealer_up):
+    """Look up the basic strategy action for a hand against the upcard"""
+    table = STRATEGY_SOFT if is_soft else STRATEGY_HARD
+    return table[player_total - 4][dealer_up - 2]
+
+
+def to_cents(dollars):
+    """Convert a dollar amount to integer cents"""
+    return round(dollars * 100)
+
+
+def fmt_money(cents):
+    """Format integer cents as dollars for display"""
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"${sign}{dollars}.{cents:02d}"
+
+
+def _write(text):
+    """Write game output to the current stdout"""
+    sys.stdout.write(text)
+
+
+def _discard(text):
+    """Drop game output when not verbose"""
 
 
 class BlackjackGame:
     """Main blackjack game class"""
     
-    def __init__(self, player_balance=100):
+    def __init__(self, player_balance=100, interactive=True, flat_bet=10,
+                 verbose=True):
         self.deck = Deck(num_decks=6)  # Casino typically uses 6 decks
-        self.player_balance = player_balance
+        self.interactive = interactive
+        # Money is held in integer cents and only shown as dollars
+        self.flat_bet_cents = to_cents(flat_bet)  # Bet each hand when not interactive
+        if self.flat_bet_cents <= 0:
+            raise ValueError("flat_bet must be at least one cent")
+        self.verbose = verbose
+        self._out = _write if verbose else _discard
+        self.player_balance_cents = to_cents(player_balance)
         self.player_hand = None
         self.dealer_hand = None
-        self.current_bet = 0
+        self.current_bet_cents = 0
         self.game_over = False
+        self.dealer_cache = None  # Built on first evaluate_hand_ev call
+        self.hole_shuffle = None
     
     def display_header(self):
         """Display game header"""
-        print("\n" + "=" * 50)
-        print(" " * 15 + "BLACKJACK")
-        print("=" * 50)
-        print(f"Player Balance: ${self.player_balance:.2f}")
-        print("=" * 50)
+        if not self.verbose:
+            return
+        rule = "=" * 50
+        self._out(f"\n{rule}\n{' ' * 15}BLACKJACK\n{rule}\n"
+                  f"Player Balance: {fmt_money(self.player_balance_cents)}\n{rule}\n")
     
     def place_bet(self):
         """Get player's bet"""
+        if not self.interactive:
+            self.current_bet_cents = min(self.flat_bet_cents, self.player_balance_cents)
+            self.player_balance_cents -= self.current_bet_cents
+            return
+        
         while True:
             try:
-                bet = float(input(f"\nPlace your bet (balance: ${self.player_balance:.2f}): $"))
-                if bet <= 0 or bet > self.player_balance:
+                balance = fmt_money(self.player_balance_cents)
+                bet = float(input(f"\nPlace your bet (balance: {balance}): $"))
+                if not isfinite(bet):
+                    print("Invalid bet amount!")
+                    continue
+                bet = to_cents(bet)
+                if bet <= 0 or bet > self.player_balance_cents:
                     print("Invalid bet amount!")
                     continue
-                self.current_bet = bet
-                self.player_balance -= bet
+                self.current_bet_cents = bet
+                self.player_balance_cents -= bet
                 return
             except ValueError:
                 print("Please enter a valid number!")
@@ -150,42 +423,48 @@ class BlackjackGame:
         for _ in range(2):
             self.player_hand.add_card(self.deck.deal_card())
             self.dealer_hand.add_card(self.deck.deal_card())
+            if len(self.dealer_hand.cards) == 1:
+                self.hole_shuffle = self.deck.shuffles  # Shuffle the hole card is from
     
     def show_hands(self, hide_dealer_first=True):
         """Display current hands"""
-        print("\n" + "-" * 50)
-        if hide_dealer_first:
-            self.dealer_hand.display("DEALER", hide_first=True)
-        else:
-            self.dealer_hand.display("DEALER")
-        self.player_hand.display("YOU")
-        print("-" * 50)
+        if not self.verbose:
+            return
+        rule = "-" * 50
+        dealer = self.dealer_hand.format("DEALER", hide_first=hide_dealer_first)
+        player = self.player_hand.format("YOU")
+        self._out(f"\n{rule}\n{dealer}\n{player}\n{rule}\n")
     
     def check_initial_blackjack(self):
         """Check for natural blackjacks"""
-        player_bj = self.player_hand.is_blackjack()
-        dealer_bj = self.dealer_hand.is_blackjack()
+        player_bj = self.player_hand.blackjack
+        dealer_bj = self.dealer_hand.blackjack
         
         if player_bj and dealer_bj:
-            print("\n🎰 Both have Blackjack! Push (Tie)")
-            self.player_balance += self.current_bet
-            return True
+            message = "Both have Blackjack! Push (Tie)"
+            self.player_balance_cents += self.current_bet_cents
         elif player_bj:
-            print("\n🎰 BLACKJACK! You Win!")
-            self.player_balance += self.current_bet * 2.5  # 3:2 payout
-            return True
+            message = "BLACKJACK! You Win!"
+            self.player_balance_cents += self.current_bet_cents * 5 // 2  # 3:2 payout
         elif dealer_bj:
-            print("\n🎰 Dealer has Blackjack! You Lose!")
-            return True
+            message = "Dealer has Blackjack! You Lose!"
+        else:
+            return False
         
-        return False
+        if self.verbose:
+            self._out(f"\n🎰 {message}\n")
+        return True
     
     def player_turn(self):
         """Handle player's actions"""
+        if not self.interactive:
+            self.auto_player_turn()
+            return
+        
         while True:
             self.show_hands(hide_dealer_first=True)
             
-            if self.player_hand.is_bust():
+            if self.player_hand.bust:
                 print("\n💥 BUST! You exceeded 21. You Lose!")
                 return
             
@@ -197,9 +476,10 @@ class BlackjackGame:
             elif choice == "S":
                 return
             elif choice == "D":
-                if len(self.player_hand.cards) == 2 and self.player_balance >= self.current_bet:
-                    self.player_balance -= self.current_bet
-                    self.current_bet *= 2
+                can_afford = self.player_balance_cents >= self.current_bet_cents
+                if len(self.player_hand.cards) == 2 and can_afford:
+                    self.player_balance_cents -= self.current_bet_cents
+                    self.current_bet_cents *= 2
                     self.player_hand.add_card(self.deck.deal_card())
                     print("Doubled down!")
                     return
@@ -208,39 +488,104 @@ class BlackjackGame:
             else:
                 print("Invalid choice! Please enter H, S, or D.")
     
+    def auto_player_turn(self):
+        """Play the player's hand by basic strategy"""
+        dealer_up = self.dealer_hand.cards[1].get_value()  # First card is hidden
+        hand = self.player_hand
+        while not hand.bust:
+            action = decide(hand.value, hand.soft, dealer_up)
+            if action == STAND:
+                return
+            if action >= DOUBLE:
+                if len(hand.cards) == 2 and self.player_balance_cents >= self.current_bet_cents:
+                    self.player_balance_cents -= self.current_bet_cents
+                    self.current_bet_cents *= 2
+                    hand.add_card(self.deck.deal_card())
+                    self._out("Doubled down!\n")
+                    self.show_hands(hide_dealer_first=True)
+                    return
+                if action == DOUBLE_STAND:
+                    return
+            hand.add_card(self.deck.deal_card())
+            self.show_hands(hide_dealer_first=True)
+        
+        self._out("\n💥 BUST! You exceeded 21. You Lose!\n")
+    
     def dealer_turn(self):
         """Execute dealer's AI (must hit on 16 or less, stand on 17+)"""
-        print("\n" + "-" * 50)
-        print("Dealer's turn...")
-        
-        while self.dealer_hand.get_value() < 17:
-            print("Dealer hits...")
+        hits = 0
+        while self.dealer_hand.value < 17:
+            hits += 1
             self.dealer_hand.add_card(self.deck.deal_card())
         
-        self.dealer_hand.display("DEALER")
+        if self.verbose:
+            self._out("\n" + "-" * 50 + "\nDealer's turn...\n"
+                      + "Dealer hits...\n" * hits
+                      + self.dealer_hand.format("DEALER") + "\n")
     
     def determine_winner(self):
         """Determine the winner and update balance"""
-        player_value = self.player_hand.get_value()
-        dealer_value = self.dealer_hand.get_value()
-        
-        print("\n" + "=" * 50)
+        player_value = self.player_hand.value
+        dealer_value = self.dealer_hand.value
         
-        if self.player_hand.is_bust():
-            print("RESULT: You Busted! 💥 You Lose!")
-        elif self.dealer_hand.is_bust():
-            print("RESULT: Dealer Busted! 🎉 You Win!")
-            self.player_balance += self.current_bet * 2
+        if self.player_hand.bust:
+            result = "You Busted! 💥 You Lose!"
+        elif self.dealer_hand.bust:
+            result = "Dealer Busted! 🎉 You Win!"
+            self.player_balance_cents += self.current_bet_cents * 2
         elif player_value > dealer_value:
-            print("RESULT: You Win! 🎉")
-            self.player_balance += self.current_bet * 2
+            result = "You Win! 🎉"
+            self.player_balance_cents += self.current_bet_cents * 2
         elif player_value < dealer_value:
-            print("RESULT: Dealer Wins! You Lose!")
+            result = "Dealer Wins! You Lose!"
         else:
-            print("RESULT: Push (Tie)! 🤝")
-            self.player_balance += self.current_bet
+            result = "Push (Tie)! 🤝"
+            self.player_balance_cents += self.current_bet_cents
         
-        print("=" * 50)
+        if self.verbose:
+            rule = "=" * 50
+            self._out(f"\n{rule}\nRESULT: {result}\n{rule}\n")
+    
+    def evaluate_hand_ev(self, player_cards, dealer_up, deck_counts=None):
+        """Expected result per unit bet of standing on player_cards against
+        dealer_up, drawing from deck_counts (defaults to the cards the
+        player cannot see: the undealt shoe plus a hidden hole card)"""
+        hand = Hand()
+        for card in player_cards:
+            hand.add_card(card)
+        if hand.bust:
+            return -1.0
+        if deck_counts is None:
+            deck_counts = self.deck.counts()
+            # The hole card was dealt but is unseen, so it is still a
+            # possible draw as far as the player knows. A reshuffle since
+            # then has already put it back into the shoe.
+            if (self.dealer_hand is not None and len(self.dealer_hand.cards) == 2
+                    and self.hole_shuffle == self.deck.shuffles):
+                deck_counts[self.dealer_hand.cards[0].get_value()] += 1
+        
+        if self.dealer_cache is None:
+            self.dealer_cache = DealerCache(num_decks=self.deck.num_decks)
+        dist = self.dealer_cache.get(dealer_up.get_value(), deck_counts)
+        player_value = hand.value
+        ev = dist[5]
+        for outcome, p in zip(range(17, 22), dist):
+            if player_value > outcome:
+                ev += p
+            elif player_value < outcome:
+                ev -= p
+        return ev
+    
+    def simulate_batch(self, num_hands, seed=None):
+        """Play num_hands flat-bet hands by basic strategy from a copy of
+        the current shoe, returns the average result per unit bet"""
+        if num_hands <= 0:
+            raise ValueError("num_hands must be positive")
+        shoe = self.deck.cards.translate(CARD_VALUES)
+        rng = random.Random(seed)
+        strategy = (STRATEGY_HARD, STRATEGY_SOFT)
+        net = play_hands(shoe, self.deck.idx, num_hands, strategy, rng)
+        return net / num_hands
     
     def play_hand(self):
         """Play a single hand"""
@@ -254,31 +599,181 @@ class BlackjackGame:
         
         self.player_turn()
         
-        if not self.player_hand.is_bust():
+        if not self.player_hand.bust:
             self.dealer_turn()
         
         self.determine_winner()
     
-    def play_game(self):
-        """Main game loop"""
-        print("\n🎰 Welcome to Blackjack! 🎰")
+    def play_game(self, max_hands=None):
+        """Main game loop
+
+        Automated games skip the prompt between hands and play until the
+        balance runs out or max_hands have been played.
+        """
+        if self.verbose:
+            self._out("\n🎰 Welcome to Blackjack! 🎰\n")
         
-        while self.player_balance > 0:
+        hands = 0
+        while self.player_balance_cents > 0:
             self.play_hand()
+            hands += 1
             
+            if not self.interactive:
+                if max_hands is not None and hands >= max_hands:
+                    break
+                continue
             choice = input("\nPlay another hand? (Y/N): ").upper()
             if choice != "Y":
                 break
         
-        print("\n" + "=" * 50)
-        print("GAME OVER!")
-        print(f"Final Balance: ${self.player_balance:.2f}")
-        print("=" * 50)
-        
-        if self.player_balance > 0:
-            print("Thanks for playing! Come back soon! 🎰")
+        if not self.verbose:
+            return
+        if self.player_balance_cents > 0:
+            farewell = "Thanks for playing! Come back soon! 🎰"
         else:
-            print("You're out of money! Better luck next time!")
+            farewell = "You're out of money! Better luck next time!"
+        rule = "=" * 50
+        self._out(f"\n{rule}\nGAME OVER!\n"
+                  f"Final Balance: {fmt_money(self.player_balance_cents)}\n"
+                  f"{rule}\n{farewell}\n")
+
+
+# Simulation engine: the game rules as plain functions over a shoe of card
+# values (2-11, ace = 11), so batch play never builds Card or Hand objects.
+
+def build_shoe(num_decks=6):
+    """Return an unshuffled shoe of card values for num_decks decks"""
+    return bytearray(range(len(CARD_TABLE))).translate(CARD_VALUES) * num_decks
+
+
+def draw(shoe, idx, rng):
+    """Draw the card at idx, reshuffling first when the shoe runs low"""
+    if len(shoe) - idx < 10:
+        rng.shuffle(shoe)
+        idx = 0
+    return shoe[idx], idx + 1
+
+
+def play_hand_fast(shoe, idx, bet, strategy, rng):
+    """Play one hand from the shoe, returns (net winnings, new shoe index)
+
+    strategy is a (hard, soft) pair of tables laid out like STRATEGY_HARD.
+    """
+    player, idx = draw(shoe, idx, rng)
+    hole, idx = draw(shoe, idx, rng)
+    card, idx = draw(shoe, idx, rng)
+    up, idx = draw(shoe, idx, rng)
+    
+    player_total = player + card
+    player_aces = (player == 11) + (card == 11)
+    if player_total == 22:  # Two aces
+        player_total = 12
+        player_aces = 1
+    dealer_total = up + hole
+    dealer_aces = (up == 11) + (hole == 11)
+    if dealer_total == 22:
+        dealer_total = 12
+        dealer_aces = 1
+    
+    # Natural blackjacks
+    if player_total == 21 and dealer_total == 21:
+        return 0, idx
+    if player_total == 21:
+        return bet * 1.5, idx
+    if dealer_total == 21:
+        return -bet, idx
+    
+    # Player's turn
+    hard, soft = strategy
+    num_cards = 2
+    while player_total < 21:
+        table = soft if player_aces else hard
+        action = table[player_total - 4][up - 2]
+        if action == STAND:
+            break
+        if action >= DOUBLE:
+            if num_cards == 2:
+                bet *= 2
+                action = STAND
+            elif action == DOUBLE_STAND:
+                break
+        card, idx = draw(shoe, idx, rng)
+        player_total += card
+        player_aces += card == 11
+        num_cards += 1
+        while player_total > 21 and player_aces:
+            player_total -= 10
+            player_aces -= 1
+        if action == STAND:
+            break
+    
+    if player_total > 21:
+        return -bet, idx
+    
+    # Dealer's turn (stands on all 17s)
+    while dealer_total < 17:
+        card, idx = draw(shoe, idx, rng)
+        dealer_total += card
+        dealer_aces += card == 11
+        while dealer_total > 21 and dealer_aces:
+            dealer_total -= 10
+            dealer_aces -= 1
+    
+    if dealer_total > 21 or player_total > dealer_total:
+        return bet, idx
+    if player_total < dealer_total:
+        return -bet, idx
+    return 0, idx
+
+
+def play_hands_fast(shoe, idx, num_hands, strategy, rng):
+    """Play num_hands flat-bet hands from the shoe, returns the net result"""
+    net = 0
+    for _ in range(num_hands):
+        result, idx = play_hand_fast(shoe, idx, 1, strategy, rng)
+        net += result
+    return net
+
+
+def play_hands(shoe, idx, num_hands, strategy, rng):
+    """Play num_hands flat-bet hands from the shoe, returns the net result
+
+    Uses the compiled core when it is built, otherwise play_hands_fast.
+    The compiled core reshuffles with its own generator seeded from rng, so
+    the same rng state gives different hands with and without it.
+    """
+    if _play_hands_compiled is None:
+        return play_hands_fast(shoe, idx, num_hands, strategy, rng)
+    hard, soft = strategy
+    return _play_hands_compiled(shoe, idx, num_hands, b"".join(hard),
+                                b"".join(soft), rng.getrandbits(64))
+
+
+def simulate(num_hands, num_decks=6, strategy=(STRATEGY_HARD, STRATEGY_SOFT),
+             seed=None):
+    """Play num_hands flat-bet hands, returns the average result per unit bet
+
+    A given seed is reproducible, but results for it differ depending on
+    whether the compiled core is built (see play_hands).
+    """
+    if num_hands <= 0:
+        raise ValueError("num_hands must be positive")
+    if num_decks < 1:
+        raise ValueError("num_decks must be at least 1")
+    rng = random.Random(seed)
+    shoe = build_shoe(num_decks)
+    rng.shuffle(shoe)
+    return play_hands(shoe, 0, num_hands, strategy, rng) / num_hands
+
+
+def run_simulation(num_hands=100000):
+    """Run a Monte Carlo simulation and report the player's edge"""
+    print("\n" + "=" * 50)
+    print(" " * 12 + "BLACKJACK SIMULATION")
+    print("=" * 50)
+    print(f"Hands played: {num_hands}")
+    print(f"Player edge: {simulate(num_hands) * 100:+.2f}%")
+    print("=" * 50)
 
 
 def main():
@@ -289,7 +784,7 @@ def main():
             print("\n" + "=" * 50)
             print(" " * 10 + "CASINO BLACKJACK")
             print("=" * 50)
-            print(f"Starting balance: ${starting_balance:.2f}")
+            print(f"Starting balance: {fmt_money(to_cents(starting_balance))}")
             print("=" * 50)
             
             game = BlackjackGame(player_balance=starting_balance)
@@ -304,5 +799,17 @@ def main():
         print("\n\nGame interrupted. Goodbye! 👋")
 
 
+SIMULATE_USAGE = "Usage: python BlackJack.py --simulate [NUM_HANDS]"
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--simulate":
+        try:
+            num_hands = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+        except ValueError:
+            num_hands = 0
+        if num_hands <= 0 or len(sys.argv) > 3:
+            sys.exit(f"{SIMULATE_USAGE}\nNUM_HANDS must be a positive integer")
+        run_simulation(num_hands)
+    else:
+        main()
@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled simulation core for BlackJack.py
+
+A line-for-line port of BlackJack.play_hands_fast that runs without the
+GIL. Shoes are buffers of card values (2-11, ace = 11) and strategy
+tables are the flattened bytes of STRATEGY_HARD / STRATEGY_SOFT.
+"""
+
+from libc.stdint cimport uint64_t
+
+cdef enum:
+    STAND = 0
+    HIT = 1
+    DOUBLE = 2
+    DOUBLE_STAND = 3
+
+cdef enum:
+    TABLE_ROWS = 18  # Player totals 4-21
+    TABLE_COLS = 10  # Dealer upcards 2-11
+
+
+cdef struct Shoe:
+    unsigned char *cards
+    Py_ssize_t size
+    Py_ssize_t idx
+    uint64_t state
+
+
+cdef inline uint64_t next_random(Shoe *shoe) noexcept nogil:
+    """splitmix64 step"""
+    cdef uint64_t z
+    shoe.state += 0x9E3779B97F4A7C15ULL
+    z = shoe.state
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+    return z ^ (z >> 31)
+
+
+cdef void shuffle(Shoe *shoe) noexcept nogil:
+    """Fisher-Yates shuffle of the whole shoe"""
+    cdef Py_ssize_t i, j
+    cdef unsigned char card
+    for i in range(shoe.size - 1, 0, -1):
+        j = <Py_ssize_t>(next_random(shoe) % <uint64_t>(i + 1))
+        card = shoe.cards[i]
+        shoe.cards[i] = shoe.cards[j]
+        shoe.cards[j] = card
+    shoe.idx = 0
+
+
+cdef inline int draw(Shoe *shoe) noexcept nogil:
+    """Draw the next card, reshuffling first when the shoe runs low"""
+    if shoe.size - shoe.idx < 10:
+        shuffle(shoe)
+    shoe.idx += 1
+    return shoe.cards[shoe.idx - 1]
+
+
+cdef int dealer_play(Shoe *shoe, int total, int aces) noexcept nogil:
+    """Draw for the dealer until 17 or more (stands on all 17s)"""
+    cdef int card
+    while total < 17:
+        card = draw(shoe)
+        total += card
+        aces += card == 11
+        while total > 21 and aces:
+            total -= 10
+            aces -= 1
+    return total
+
+
+cdef double play_hand(Shoe *shoe, const unsigned char *hard,
+                      const unsigned char *soft) noexcept nogil:
+    """Play one flat-bet hand, returns the net result"""
+    cdef int player = draw(shoe)
+    cdef int hole = draw(shoe)
+    cdef int card = draw(shoe)
+    cdef int up = draw(shoe)
+    cdef double bet = 1.0
+    cdef int player_total, player_aces, dealer_total, dealer_aces
+    cdef int num_cards, action
+    cdef const unsigned char *table
+
+    player_total = player + card
+    player_aces = (player == 11) + (card == 11)
+    if player_total == 22:  # Two aces
+        player_total = 12
+        player_aces = 1
+    dealer_total = up + hole
+    dealer_aces = (up == 11) + (hole == 11)
+    if dealer_total == 22:
+        dealer_total = 12
+        dealer_aces = 1
+
+    # Natural blackjacks
+    if player_total == 21 and dealer_total == 21:
+        return 0.0
+    if player_total == 21:
+        return bet * 1.5
+    if dealer_total == 21:
+        return -bet
+
+    # Player's turn
+    num_cards = 2
+    while player_total < 21:
+        table = soft if player_aces else hard
+        action = table[(player_total - 4) * TABLE_COLS + up - 2]
+        if action == STAND:
+            break
+        if action >= DOUBLE:
+            if num_cards == 2:
+                bet *= 2
+                action = STAND
+            elif action == DOUBLE_STAND:
+                break
+        card = draw(shoe)
+        player_total += card
+        player_aces += card == 11
+        num_cards += 1
+        while player_total > 21 and player_aces:
+            player_total -= 10
+            player_aces -= 1
+        if action == STAND:
+            break
+
+    if player_total > 21:
+        return -bet
+
+    dealer_total = dealer_play(shoe, dealer_total, dealer_aces)
+
+    if dealer_total > 21 or player_total > dealer_total:
+        return bet
+    if player_total < dealer_total:
+        return -bet
+    return 0.0
+
+
+def play_hands(unsigned char[::1] shoe, Py_ssize_t idx, Py_ssize_t num_hands,
+               const unsigned char[::1] hard, const unsigned char[::1] soft,
+               uint64_t seed):
+    """Play num_hands flat-bet hands from the shoe, returns the net result"""
+    if hard.shape[0] != TABLE_ROWS * TABLE_COLS or soft.shape[0] != TABLE_ROWS * TABLE_COLS:
+        raise ValueError("Strategy tables must be 18 rows of 10 actions")
+    if shoe.shape[0] == 0:
+        raise ValueError("Shoe is empty")
+    if not 0 <= idx <= shoe.shape[0]:
+        raise ValueError("Shoe index out of range")
+
+    cdef Shoe state
+    cdef double net = 0.0
+    cdef Py_ssize_t i
+    state.cards = &shoe[0]
+    state.size = shoe.shape[0]
+    state.idx = idx
+    state.state = seed
+
+    with nogil:
+        for i in range(num_hands):
+            net += play_hand(&state, &hard[0], &soft[0])
+    return net
@@ -0,0 +1,22 @@
+from setuptools import Extension, setup
+
+# The compiled core is optional: if Cython or a C compiler is missing the
+# build still installs BlackJack.py, which falls back to its own kernel.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize([Extension("blackjack_core", ["blackjack_core.pyx"])],
+                            language_level=3)
+    for ext in ext_modules:
+        ext.optional = True  # cythonize does not carry this over
+
+setup(
+    name="blackjack",
+    version="0.1.0",
+    description="Casino blackjack in the terminal, with a Monte Carlo simulator",
+    py_modules=["BlackJack"],
+    ext_modules=ext_modules,
+    python_requires=">=3.8",
+)
@@ -0,0 +1,56 @@
+"""Tests for the game engine in BlackJack.py"""
+import unittest
+
+import BlackJack
+
+
+class EvaluateHandEvTest(unittest.TestCase):
+    
+    def deal(self, start):
+        """Deal a quiet hand with the shoe cursor at start"""
+        game = BlackJack.BlackjackGame(interactive=False, verbose=False)
+        game.deck = BlackJack.Deck(num_decks=6, seed=7)
+        game.deck.idx = start
+        game.deal_initial_hands()
+        return game
+    
+    def test_hole_card_counts_as_unseen(self):
+        game = self.deal(0)
+        counts = game.deck.counts()
+        counts[game.dealer_hand.cards[0].get_value()] += 1
+        player_cards, up = game.player_hand.cards, game.dealer_hand.cards[1]
+        self.assertEqual(game.evaluate_hand_ev(player_cards, up),
+                         game.evaluate_hand_ev(player_cards, up, counts))
+    
+    def test_reshuffle_after_hole_card(self):
+        # Two cards are dealt before the shoe runs low, so it reshuffles
+        # after the hole card and already holds it again
+        game = self.deal(52 * 6 - 11)
+        self.assertEqual(game.deck.shuffles, 2)
+        counts = game.deck.counts()
+        player_cards, up = game.player_hand.cards, game.dealer_hand.cards[1]
+        self.assertEqual(game.evaluate_hand_ev(player_cards, up),
+                         game.evaluate_hand_ev(player_cards, up, counts))
+
+
+
+class MoneyTest(unittest.TestCase):
+    
+    def test_fmt_money(self):
+        self.assertEqual(BlackJack.fmt_money(12345), "$123.45")
+        self.assertEqual(BlackJack.fmt_money(5), "$0.05")
+        self.assertEqual(BlackJack.fmt_money(0), "$0.00")
+        self.assertEqual(BlackJack.fmt_money(-5), "$-0.05")
+        self.assertEqual(BlackJack.fmt_money(-150), "$-1.50")
+
+
+class FlatBetTest(unittest.TestCase):
+    
+    def test_rejects_non_positive_flat_bet(self):
+        for flat_bet in (0, -10, 0.001):
+            with self.subTest(flat_bet=flat_bet):
+                with self.assertRaises(ValueError):
+                    BlackJack.BlackjackGame(interactive=False, flat_bet=flat_bet)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Parity check between the pure-Python and compiled simulation kernels"""
+import random
+import unittest
+
+import BlackJack
+
+try:
+    import blackjack_core
+except ImportError:
+    blackjack_core = None
+
+
+class NoShuffle:
+    """Stand-in generator that fails the check if the shoe is reshuffled"""
+    
+    def shuffle(self, shoe):
+        raise AssertionError("Shoe reshuffled, kernels no longer comparable")
+
+
+@unittest.skipIf(blackjack_core is None, "compiled core not built")
+class CompiledCoreParityTest(unittest.TestCase):
+    
+    def test_matches_python_kernel(self):
+        # 200 decks is far more than 1000 hands can use, so neither kernel
+        # reshuffles and both must play exactly the same cards
+        hard, soft = BlackJack.STRATEGY_HARD, BlackJack.STRATEGY_SOFT
+        for seed in range(50):
+            with self.subTest(seed=seed):
+                shoe = BlackJack.build_shoe(200)
+                random.Random(seed).shuffle(shoe)
+                expected = BlackJack.play_hands_fast(
+                    bytearray(shoe), 0, 1000, (hard, soft), NoShuffle())
+                actual = blackjack_core.play_hands(
+                    bytearray(shoe), 0, 1000, b"".join(hard), b"".join(soft), seed)
+                self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()